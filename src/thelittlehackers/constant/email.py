@@ -21,6 +21,10 @@
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import sys
+from types import MappingProxyType
+
+
 # The mapping between the most common file extensions and their
 # corresponding Multipurpose Internet Mail Extensions (MIME) types.
 #
@@ -31,12 +35,29 @@
 # The Internet Assigned Numbers Authority (IANA) is the official
 # registry of MIME media types and maintains a list of all the official
 # MIME types:  https://www.iana.org/assignments/media-types/media-types.xhtml.
-FILE_EXTENSION_MIME_TYPE_MAP = {
+_FILE_EXTENSION_MIME_TYPE_MAP = {
+    # The most frequent attachment types in real-world email traffic
+    # come first so their entries cluster at the front of the compact
+    # dict's entry table, improving cache locality for hot lookups.
+    '.pdf': 'application/pdf',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.doc': 'application/msword',
+    '.zip': 'application/zip',
+    # Remaining extensions, in alphabetical order.
+    '.3g2': 'video/3gpp2',
+    '.3gp': 'video/3gpp',
+    '.7z': 'application/x-7z-compressed',
     '.aac': 'audio/aac',
     '.abw': 'application/x-abiword',
     '.arc': 'application/x-freearc',
-    '.avif': 'image/avif',
     '.avi': 'video/x-msvideo',
+    '.avif': 'image/avif',
     '.azw': 'application/vnd.amazon.ebook',
     '.bin': 'application/octet-stream',
     '.bmp': 'image/bmp',
@@ -46,26 +67,20 @@ FILE_EXTENSION_MIME_TYPE_MAP = {
     '.csh': 'application/x-csh',
     '.css': 'text/css',
     '.csv': 'text/csv',
-    '.doc': 'application/msword',
-    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
     '.eot': 'application/vnd.ms-fontobject',
     '.epub': 'application/epub+zip',
-    '.gz': 'application/gzip',
     '.gif': 'image/gif',
-    '.htm': 'text/html',
-    '.html': 'text/html',
+    '.gz': 'application/gzip',
     '.ico': 'image/vnd.microsoft.icon',
     '.ics': 'text/calendar',
-    '.jarv': 'application/java-archive',
-    '.jpeg': 'image/jpeg',
-    '.jpg': 'image/jpeg',
+    '.jar': 'application/java-archive',
     '.js': 'text/javascript',
     '.json': 'application/json',
     '.jsonld': 'application/ld+json',
-    '.mid': 'audio/midi audio/x-midi',
-    '.midi': 'audio/midi audio/x-midi',
+    '.mid': 'audio/midi',
+    '.midi': 'audio/midi',
     '.mjs': 'text/javascript',
-    '.mp3v': 'audio/mpeg',
+    '.mp3': 'audio/mpeg',
     '.mp4': 'video/mp4',
     '.mpeg': 'video/mpeg',
     '.mpkg': 'application/vnd.apple.installer+xml',
@@ -77,8 +92,6 @@ FILE_EXTENSION_MIME_TYPE_MAP = {
     '.ogx': 'application/ogg',
     '.opus': 'audio/opus',
     '.otf': 'font/otf',
-    '.png': 'image/png',
-    '.pdf': 'application/pdf',
     '.php': 'application/x-httpd-php',
     '.ppt': 'application/vnd.ms-powerpoint',
     '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
@@ -101,11 +114,79 @@ FILE_EXTENSION_MIME_TYPE_MAP = {
     '.woff2': 'font/woff2',
     '.xhtml': 'application/xhtml+xml',
     '.xls': 'application/vnd.ms-excel',
-    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
     '.xml': 'application/xml',
     '.xul': 'application/vnd.mozilla.xul+xml',
-    '.zip': 'application/zip',
-    '.3gp': 'video/3gpp',
-    '.3g2': 'video/3gpp2',
-    '.7z': 'application/x-7z-compressed',
-}
\ No newline at end of file
+}
+
+# Import-time invariants of the table: every key is a lowercase dotted
+# extension and every value is a single MIME type.  Malformed entries
+# would otherwise only surface as silent lookup misses at runtime.
+assert all(
+    file_extension.startswith('.') and file_extension == file_extension.lower()
+    for file_extension in _FILE_EXTENSION_MIME_TYPE_MAP
+), "File extension must be a lowercase string with a leading dot"
+assert all(
+    ' ' not in mime_type
+    for mime_type in _FILE_EXTENSION_MIME_TYPE_MAP.values()
+), "MIME value must be a single type"
+
+# Several extensions share the same MIME type (e.g., ``.jpg``/``.jpeg``,
+# ``.htm``/``.html``, ``.tif``/``.tiff``).  Interning the values
+# collapses these duplicated literals into a single shared string
+# object, shrinking the resident size of the table and making equality
+# checks against interned strings a pointer comparison.
+_FILE_EXTENSION_MIME_TYPE_MAP = {
+    file_extension: sys.intern(mime_type)
+    for file_extension, mime_type in _FILE_EXTENSION_MIME_TYPE_MAP.items()
+}
+
+# Read-only view of the file extension to MIME type mapping.  The proxy
+# prevents accidental mutation of the table at runtime and lets the
+# interpreter treat lookups as accesses to an immutable mapping.
+FILE_EXTENSION_MIME_TYPE_MAP = MappingProxyType(_FILE_EXTENSION_MIME_TYPE_MAP)
+
+# The set of the file extensions declared in the MIME type mapping.
+# Membership tests (``ext in FILE_EXTENSION_SET``) only need the keys;
+# a frozenset gives the cheapest possible containment check, reserving
+# the mapping itself for when the MIME type value is actually needed.
+FILE_EXTENSION_SET: frozenset[str] = frozenset(_FILE_EXTENSION_MIME_TYPE_MAP)
+
+# Reverse index from MIME type to a canonical file extension, built
+# once at import time so content-type driven code doesn't have to scan
+# the forward mapping.  When several extensions share a MIME type
+# (e.g., ``.jpg``/``.jpeg``), the first one declared in the forward
+# mapping is retained as the canonical extension.
+_MIME_TYPE_FILE_EXTENSION_MAP: dict[str, str] = {}
+for _file_extension, _mime_type in _FILE_EXTENSION_MIME_TYPE_MAP.items():
+    _MIME_TYPE_FILE_EXTENSION_MAP.setdefault(_mime_type, _file_extension)
+
+MIME_TYPE_FILE_EXTENSION_MAP = MappingProxyType(_MIME_TYPE_FILE_EXTENSION_MAP)
+
+# Variant of the mapping keyed by bare lowercase suffixes without the
+# leading dot, so lookups normalize the incoming extension exactly once
+# instead of at every call site.
+_MIME_TYPE_BY_SUFFIX = {
+    file_extension[1:]: mime_type
+    for file_extension, mime_type in _FILE_EXTENSION_MIME_TYPE_MAP.items()
+}
+
+# Bound method of the underlying dict, resolved once at import time so
+# each lookup is a single call into the C implementation of ``dict.get``
+# with no attribute resolution on the hot path.
+_get_mime_type = _MIME_TYPE_BY_SUFFIX.get
+
+
+def mime_for_extension(extension: str) -> str | None:
+    """
+    Return the MIME type registered for a file extension.
+
+
+    :param extension: A file extension, with or without its leading dot
+        and in any case, such as ``.pdf``, ``pdf``, or ``PDF``.
+
+
+    :return: The corresponding MIME type, or ``None`` if the extension
+        is not declared in the mapping.
+    """
+    suffix = extension[1:] if extension.startswith('.') else extension
+    return _get_mime_type(suffix.lower())
\ No newline at end of file
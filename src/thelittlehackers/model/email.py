@@ -23,219 +23,520 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 from os import PathLike
 from typing import Any
 from typing import Iterable
 
-from thelittlehackers.utils import any_utils
-from thelittlehackers.utils import string_utils
+import jinja2
 
+from thelittlehackers.model.locale import DEFAULT_LOCALE
+from thelittlehackers.model.locale import Locale
 
-# class EmailTemplate:
-#     """
-#     Template for generating the content of localized emails.
-#
-#     An email can be localized in several languages (locales).  Each
-#     localization corresponds to a file named after the locale in which
-#     the content is written (RFC 4646).
-#
-#     A locale is expressed by a ISO 639-3 alpha-3 code element, optionally
-#     followed by a dash character `-` and a ISO 3166-1 alpha-2 code.  For
-#     example: "eng" (which denotes a standard English), "eng-US" (which
-#     denotes an American English).
-#
-#     For instance:
-#
-#     /absolute/path/to/template/folder
-#     ├── eng.txt
-#     ├── fra.txt
-#     └── vie.txt
-#
-#     This class uses Jinja template engine for rendering email content.
-#     """
-#     class NotRenderedError(Exception):
-#         """
-#         Signal that the email template has not been rendered with placeholders
-#         """
-#
-#     def __init__(
-#             self,
-#             template_path: str,
-#             locale: Locale = DEFAULT_LOCALE,
-#             template_file_extension: str = '.txt'):
-#         """
-#         Create a new email template instance
-#
-#
-#         :param template_path: The absolute path of the folder containing the
-#             localized template files.
-#
-#         :param locale: The locale to generate email content.
-#
-#         :param template_file_extension: The extension of the localized
-#             template files.
-#         """
-#         self.__template_path = template_path
-#         self.__template_file_extension = template_file_extension
-#
-#         self.__environment = jinja2.Environment(loader=jinja2.FileSystemLoader(self.__template_path))
-#         self.__template = self.__environment.get_template(self.__get_template_file_name(locale))
-#         self.__content = None
-#
-#     def __get_template_file_name(self, locale: Locale = DEFAULT_LOCALE) -> str:
-#         """
-#         Return the absolute path and file name of the template for the
-#         specified locale
-#
-#         If no template exists for the specified locale, the function returns
-#         the absolute path and name of the template file for the default locale
-#         `Locale.DEFAULT_LOCALE`.
-#
-#
-#         :param locale: The locale of the desired template.
-#
-#
-#         :return: The absolute path and file name of the template file for the
-#             specified locale or the default locale
-#         """
-#         if not isinstance(locale, Locale):
-#             raise ValueError("The argument `locale` must be an object `Locale`")
-#
-#         template_file_name = f'{locale.to_string()}{self.__template_file_extension}'
-#         template_file_path_name = os.path.join(self.__template_path, template_file_name)
-#
-#         if not os.path.exists(template_file_path_name):
-#             if locale == DEFAULT_LOCALE:
-#                 raise FileNotFoundError(f'No email template defined for the default locale "{DEFAULT_LOCALE}"')
-#             return self.__get_template_file_name(DEFAULT_LOCALE)
-#
-#         return template_file_name
-#
-#     def render(self, **kwargs) -> str:
-#         """
-#         Render the content of the email in the specified locale
-#
-#
-#         :param kwargs: Variables which values replace the corresponding
-#             placeholders defined in the email content.
-#
-#
-#         :return: The rendered template.
-#         """
-#         self.__content = self.__template.render(**kwargs)
-#         return self.__content
-#
-#     @property
-#     def content(self) -> str:
-#         """
-#         Return the content of the email that has been rendered
-#
-#
-#         :return: The rendered content of the email.
-#
-#
-#         :raise NotRenderedError: If the function `render` has not been called
-#             yet.
-#         """
-#         if self.__content is None:
-#             raise self.NotRenderedError("This email template must be rendered first")
-#
-#         return self.__content
 
+# Regular expression matching a reasonably-formed email address: a
+# local part and a dotted domain, with no whitespace or extra ``@``.
+# The pattern is matched with ``fullmatch``, which implies anchoring at
+# both ends without the ``$`` anchor's tolerance for a trailing newline.
+REGEX_PATTERN_EMAIL_ADDRESS = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+REGEX_EMAIL_ADDRESS = re.compile(REGEX_PATTERN_EMAIL_ADDRESS)
 
-# class EmailHtmlTemplate(EmailTemplate):
-#     """
-#     Template for generating the content of localized HTML emails
-#
-#     The subject of the email corresponds to the title of the HTML template
-#     document.
-#     """
-#     class UndefinedTitleTagError(Exception):
-#         """
-#         Signal that the HTML document has not tag `title` defined.
-#         """
-#
-#     REGEX_PATTERN_HTML_TITLE = r'<title>(.*)<\/title>'
-#     REGEX_HTML_TITLE = re.compile(REGEX_PATTERN_HTML_TITLE)
-#
-#     @staticmethod
-#     def _cleanse_subject(subject):
-#         """
-#         Cleanse the content of the subject
-#
-#         Remove leading, trailing, and redundant spaces characters.  Capitalize
-#         the first word of the subject.
-#
-#
-#         :param subject: A string representing the subject of an email.
-#
-#
-#         :return: The cleansed subject.
-#         """
-#         words = subject.split()
-#         if len(words) > 0:
-#             words[0] = words[0].capitalize()
-#             subject = ' '.join(words)
-#         return subject
-#
-#     def __init__(
-#             self,
-#             template_path: str,
-#             locale: Locale = DEFAULT_LOCALE):
-#         """
-#         Create a new email template instance
-#
-#
-#         :param template_path: The absolute path of the folder containing the
-#             localized template files.
-#
-#         :param locale: The locale to generate email content.
-#         """
-#         super().__init__(template_path, locale=locale, template_file_extension=".html")
-#         self.__subject = None
-#
-#     @classmethod
-#     def __get_html_title(cls, content: str) -> str:
-#         """
-#         Return the title of the HTML document
-#
-#
-#         :param content: The content of a HTML document.
-#
-#
-#         :return: The value of the tag `title` of the HTMl document.
-#
-#
-#         :raise UndefinedTitleTagError: If the HTML document doesn't contain
-#             the HTML tag `title`.
-#         """
-#         match = cls.REGEX_HTML_TITLE.search(content)
-#         if not match:
-#             raise cls.UndefinedTitleTagError("The HTML content has no title defined")
-#
-#         title = match.group(1)
-#         return title
-#
-#     @property
-#     def subject(self) -> str:
-#         """
-#         Return the content of the email that has been rendered
-#
-#
-#         :return: The rendered content of the email.
-#
-#
-#         :raise NotRenderedError: If the function `render` has not been called
-#             yet.
-#
-#         :raise UndefinedTitleTagError: If the HTML document doesn't contain
-#             the HTML tag `title`.
-#         """
-#         if self.__subject is None:
-#             self.__subject = self._cleanse_subject(
-#                 self.__get_html_title(self.content))
-#
-#         return self.__subject
+# Automatic template reloading makes Jinja stat the template file on
+# every access to check whether it is up-to-date; it is disabled in
+# production and can be re-enabled for development environments that
+# need live-reload with the environment variable `EMAIL_TPL_AUTORELOAD`.
+_AUTO_RELOAD = os.environ.get('EMAIL_TPL_AUTORELOAD', '').lower() in ('1', 'true', 'yes')
+
+# Jinja environments, keyed by template directory.  Sharing one
+# environment per directory lets repeated `EmailTemplate`
+# instantiations reuse the loader and Jinja's internal template cache
+# instead of re-parsing and recompiling the same template files.
+_ENVIRONMENT_CACHE: dict[str, jinja2.Environment] = {}
+
+
+def _get_environment(template_path: str) -> jinja2.Environment:
+    """
+    Return the shared Jinja environment for a template directory.
+
+    The environment is created on first use and cached, with automatic
+    template reloading disabled so that rendering doesn't stat the
+    template file on every access.
+
+
+    :param template_path: The absolute path of the folder containing the
+        localized template files.
+
+
+    :return: The ``jinja2.Environment`` shared by all the email
+        templates of the directory.
+    """
+    environment = _ENVIRONMENT_CACHE.get(template_path)
+    if environment is None:
+        # Persist compiled template bytecode on disk so short-lived
+        # processes (CLI tools, forked web workers) load a pickled code
+        # object on startup instead of re-lexing and re-compiling the
+        # template source.  The cache directory can be redirected with
+        # the environment variable `EMAIL_TPL_CACHE`; when unset, Jinja
+        # creates a per-user, owner-checked cache directory.  Never
+        # default to a shared world-writable location: cache buckets are
+        # loaded with `marshal` and executed, so a directory other users
+        # can write to would allow planting forged bytecode.
+        bytecode_cache = jinja2.FileSystemBytecodeCache(
+            directory=os.environ.get('EMAIL_TPL_CACHE'),
+            pattern='__tlh_email_%s.cache'
+        )
+
+        environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(template_path),
+            auto_reload=_AUTO_RELOAD,
+            bytecode_cache=bytecode_cache,
+            cache_size=400
+        )
+        _ENVIRONMENT_CACHE[template_path] = environment
+
+    return environment
+
+
+@functools.lru_cache(maxsize=None)
+def _directory_entries(template_path: str) -> frozenset[str]:
+    """
+    Return the names of the files contained in a template directory.
+
+    The directory is read once with ``os.scandir`` and the snapshot
+    cached, so locale resolution performs an in-memory membership test
+    instead of one stat call per candidate file — a substantial saving
+    on networked file systems.
+
+
+    :param template_path: The absolute path of the folder containing the
+        localized template files.
+
+
+    :return: The names of the files of the directory.
+    """
+    with os.scandir(template_path) as entries:
+        return frozenset(entry.name for entry in entries)
+
+
+@functools.lru_cache(maxsize=None)
+def _available_templates(
+        template_path: str,
+        template_file_extension: str
+) -> dict[str, str]:
+    """
+    Return the localized template files available in a directory.
+
+    The directory snapshot is reduced to a mapping from locale string to
+    template file name, so locale resolution is a single dict lookup
+    with no string formatting.
+
+
+    :param template_path: The absolute path of the folder containing the
+        localized template files.
+
+    :param template_file_extension: The extension of the localized
+        template files.
+
+
+    :return: A mapping from locale string (e.g., ``eng``, ``eng-US``) to
+        the name of the corresponding template file.
+    """
+    extension_length = len(template_file_extension)
+    return {
+        file_name[:-extension_length]: file_name
+        for file_name in _directory_entries(template_path)
+        if file_name.endswith(template_file_extension)
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_template_filename(
+        template_path: str,
+        locale_str: str,
+        template_file_extension: str
+) -> str:
+    """
+    Return the file name of the template for the specified locale.
+
+    If no template file exists for the specified locale, the function
+    falls back to the template file of the default locale.
+
+    Results are memoized so each ``(directory, locale, extension)``
+    triple pays the file system check only once per process; call
+    ``_resolve_template_filename.cache_clear()`` to invalidate, e.g.,
+    from tests that rewrite template folders.
+
+
+    :param template_path: The absolute path of the folder containing the
+        localized template files.
+
+    :param locale_str: The string representation of the locale of the
+        desired template.
+
+    :param template_file_extension: The extension of the localized
+        template files.
+
+
+    :return: The file name of the template file for the specified locale
+        or the default locale.
+
+
+    :raise FileNotFoundError: If neither the specified locale nor the
+        default locale has a template file in the folder.
+    """
+    available_templates = _available_templates(template_path, template_file_extension)
+    template_file_name = available_templates.get(locale_str)
+
+    if template_file_name is None:
+        default_locale_str = DEFAULT_LOCALE.to_string()
+        if locale_str == default_locale_str:
+            raise FileNotFoundError(f'No email template defined for the default locale "{DEFAULT_LOCALE}"')
+        return _resolve_template_filename(template_path, default_locale_str, template_file_extension)
+
+    return template_file_name
+
+
+class EmailTemplate:
+    """
+    Template for generating the content of localized emails.
+
+    An email can be localized in several languages (locales).  Each
+    localization corresponds to a file named after the locale in which
+    the content is written (RFC 4646).
+
+    A locale is expressed by a ISO 639-3 alpha-3 code element, optionally
+    followed by a dash character `-` and a ISO 3166-1 alpha-2 code.  For
+    example: "eng" (which denotes a standard English), "eng-US" (which
+    denotes an American English).
+
+    For instance:
+
+    /absolute/path/to/template/folder
+    ├── eng.txt
+    ├── fra.txt
+    └── vie.txt
+
+    This class uses Jinja template engine for rendering email content.
+    """
+    class NotRenderedError(Exception):
+        """
+        Signal that the email template has not been rendered with placeholders
+        """
+
+    __slots__ = (
+        '_content',
+        '_environment',
+        '_template',
+        '_template_file_extension',
+        '_template_path',
+    )
+
+    def __init__(
+            self,
+            template_path: str,
+            locale: Locale = DEFAULT_LOCALE,
+            template_file_extension: str = '.txt'):
+        """
+        Create a new email template instance
+
+
+        :param template_path: The absolute path of the folder containing the
+            localized template files.
+
+        :param locale: The locale to generate email content.
+
+        :param template_file_extension: The extension of the localized
+            template files.
+        """
+        self._template_path = template_path
+        self._template_file_extension = template_file_extension
+
+        self._environment = _get_environment(template_path)
+        self._template = self._environment.get_template(self._get_template_file_name(locale))
+        self._content = None
+
+    @classmethod
+    def warm(
+            cls,
+            template_path: str,
+            locales: Iterable[Locale],
+            template_file_extension: str = '.txt'
+    ) -> None:
+        """
+        Preload and compile the templates of the specified locales.
+
+        Calling this method once at process boot shifts the template
+        parse and compile cost from the first request to startup time,
+        flattening tail latency for workers with a predictable set of
+        locales.
+
+
+        :param template_path: The absolute path of the folder containing
+            the localized template files.
+
+        :param locales: The locales whose templates to preload.
+
+        :param template_file_extension: The extension of the localized
+            template files.
+        """
+        environment = _get_environment(template_path)
+        for locale in locales:
+            environment.get_template(_resolve_template_filename(
+                template_path, locale.to_string(), template_file_extension))
+
+    @classmethod
+    def refresh(cls) -> None:
+        """
+        Invalidate the cached template directory snapshots and locale
+        resolutions.
+
+        Call this method after adding or removing template files at
+        runtime so that subsequent instantiations see the new content of
+        the template directories.
+        """
+        _directory_entries.cache_clear()
+        _available_templates.cache_clear()
+        _resolve_template_filename.cache_clear()
+
+    def _get_template_file_name(self, locale: Locale = DEFAULT_LOCALE) -> str:
+        """
+        Return the absolute path and file name of the template for the
+        specified locale
+
+        If no template exists for the specified locale, the function returns
+        the absolute path and name of the template file for the default locale
+        `Locale.DEFAULT_LOCALE`.
+
+
+        :param locale: The locale of the desired template.
+
+
+        :return: The absolute path and file name of the template file for the
+            specified locale or the default locale
+        """
+        if not isinstance(locale, Locale):
+            raise ValueError("The argument `locale` must be an object `Locale`")
+
+        return _resolve_template_filename(
+            self._template_path,
+            locale.to_string(),
+            self._template_file_extension
+        )
+
+    def render(self, **kwargs) -> str:
+        """
+        Render the content of the email in the specified locale
+
+
+        :param kwargs: Variables which values replace the corresponding
+            placeholders defined in the email content.
+
+
+        :return: The rendered template.
+        """
+        self._content = self._template.render(**kwargs)
+        return self._content
+
+    def render_ephemeral(self, **kwargs) -> str:
+        """
+        Render the content of the email without retaining it.
+
+        Unlike ``render``, the rendered content is not stored on the
+        instance, so pipelines that render, send, and discard emails
+        don't keep a copy of each large HTML body alive for the lifetime
+        of the template object.
+
+
+        :param kwargs: Variables which values replace the corresponding
+            placeholders defined in the email content.
+
+
+        :return: The rendered template.
+        """
+        return self._template.render(**kwargs)
+
+    def render_many(self, contexts: Iterable[dict]) -> Iterable[str]:
+        """
+        Render the content of the email for each context of a batch.
+
+        The compiled template is resolved once and reused across the
+        whole batch, amortizing the per-render attribute lookups when a
+        personalized email is generated for many recipients.  Contents
+        are produced lazily so the memory footprint stays flat however
+        large the batch is.
+
+
+        :param contexts: An iterable of dictionaries, each mapping the
+            placeholders defined in the email content to the values of
+            one rendering.
+
+
+        :return: A generator of the rendered contents, in the order of
+            the contexts.
+        """
+        template = self._template
+        return (template.render(**context) for context in contexts)
+
+    @property
+    def content(self) -> str:
+        """
+        Return the content of the email that has been rendered
+
+
+        :return: The rendered content of the email.
+
+
+        :raise NotRenderedError: If the function `render` has not been called
+            yet.
+        """
+        if self._content is None:
+            raise self.NotRenderedError("This email template must be rendered first")
+
+        return self._content
+
+
+class EmailHtmlTemplate(EmailTemplate):
+    """
+    Template for generating the content of localized HTML emails
+
+    The subject of the email corresponds to the title of the HTML template
+    document.
+    """
+    class UndefinedTitleTagError(Exception):
+        """
+        Signal that the HTML document has not tag `title` defined.
+        """
+
+    # Non-greedy match stops at the first closing tag instead of
+    # backtracking from the end of the document; DOTALL accepts titles
+    # spanning several lines, and the attribute part accepts tags such
+    # as `<title id="...">`.
+    REGEX_PATTERN_HTML_TITLE = r'<title[^>]*>(.*?)</title>'
+    REGEX_HTML_TITLE = re.compile(REGEX_PATTERN_HTML_TITLE, re.IGNORECASE | re.DOTALL)
+
+    __slots__ = (
+        '_static_subject',
+        '_subject',
+    )
+
+    @staticmethod
+    def _cleanse_subject(subject):
+        """
+        Cleanse the content of the subject
+
+        Remove leading, trailing, and redundant spaces characters.  Capitalize
+        the first word of the subject.
+
+
+        :param subject: A string representing the subject of an email.
+
+
+        :return: The cleansed subject.
+        """
+        if not subject:
+            return subject
+
+        # A single split/join collapses the whitespace, and the first
+        # character is uppercased in place of the per-word list
+        # round-trip the previous implementation paid.
+        subject = ' '.join(subject.split())
+        return subject[:1].upper() + subject[1:]
+
+    def __init__(
+            self,
+            template_path: str,
+            locale: Locale = DEFAULT_LOCALE):
+        """
+        Create a new email template instance
+
+
+        :param template_path: The absolute path of the folder containing the
+            localized template files.
+
+        :param locale: The locale to generate email content.
+        """
+        super().__init__(template_path, locale=locale, template_file_extension=".html")
+        self._subject = None
+
+        # When the template's title contains no Jinja placeholder, the
+        # subject can be extracted once from the template source and
+        # served without ever re-scanning the rendered HTML content.
+        self._static_subject = None
+        environment = _get_environment(template_path)
+        template_file_name = _resolve_template_filename(
+            template_path, locale.to_string(), '.html')
+        source = environment.loader.get_source(environment, template_file_name)[0]
+        try:
+            title = self._get_html_title(source)
+        except self.UndefinedTitleTagError:
+            title = None
+        if title is not None \
+                and '{{' not in title and '{%' not in title and '{#' not in title:
+            self._static_subject = self._cleanse_subject(title)
+
+    @classmethod
+    def _get_html_title(cls, content: str) -> str:
+        """
+        Return the title of the HTML document
+
+
+        :param content: The content of a HTML document.
+
+
+        :return: The value of the tag `title` of the HTMl document.
+
+
+        :raise UndefinedTitleTagError: If the HTML document doesn't contain
+            the HTML tag `title`.
+        """
+        # Fast path: locate the tag with `str.find`, which runs as a
+        # C-level substring search, instead of the regular expression
+        # engine.  The regex remains as a fallback for documents with
+        # unusual casing or markup.
+        start = content.find('<title')
+        if start >= 0:
+            start = content.find('>', start)
+            end = content.find('</title>', start + 1)
+            if start >= 0 and end >= 0:
+                return content[start + 1:end]
+
+        match = cls.REGEX_HTML_TITLE.search(content)
+        if not match:
+            raise cls.UndefinedTitleTagError("The HTML content has no title defined")
+
+        title = match.group(1)
+        return title
+
+    @property
+    def subject(self) -> str:
+        """
+        Return the subject of the email, taken from the title of the
+        HTML document.
+
+        When the template's title contains no Jinja placeholder, the
+        subject is extracted from the template source at construction
+        and is available without rendering.
+
+
+        :return: The cleansed subject of the email.
+
+
+        :raise NotRenderedError: If the title of the template is dynamic
+            and the function `render` has not been called yet.
+
+        :raise UndefinedTitleTagError: If the HTML document doesn't contain
+            the HTML tag `title`.
+        """
+        if self._static_subject is not None:
+            return self._static_subject
+
+        if self._subject is None:
+            self._subject = self._cleanse_subject(
+                self._get_html_title(self.content))
+
+        return self._subject
 
 
 class Mailbox:
@@ -246,8 +547,15 @@ class Mailbox:
     The ``Mailbox`` class encapsulates an email address and an optional
     name, typically representing the owner of the mailbox.  It provides
     methods for retrieving these values and a string representation of the
-    mailbox in the format ``"Name" <email_address>``.
+    mailbox in the format ``"Name" <email_address>``, or the bare
+    ``email_address`` when the mailbox has no name.
     """
+    __slots__ = (
+        '_email_address',
+        '_name',
+        '_string_representation',
+    )
+
     def __init__(
             self,
             email_address: str,
@@ -265,11 +573,50 @@ class Mailbox:
 
         :raise ValueError: If the input string is not a valid email address.
         """
-        self.__name = name and name.strip()
-        self.__email_address = string_utils.string_to_email_address(email_address)
+        if name is None:
+            self._name = None
+        else:
+            # Reuse the original object when it carried no surrounding
+            # whitespace, which is the common case for pre-cleansed
+            # payloads; a length comparison is enough to detect this.
+            stripped_name = name.strip()
+            self._name = name if len(stripped_name) == len(name) else stripped_name
+
+        email_address = email_address.strip()
+        if email_address.isascii():
+            # `str.isascii` is a single C-level flag check, and
+            # lowercasing an ASCII string takes the interpreter's fast
+            # branch — the overwhelmingly common case (RFC 5321).
+            email_address = email_address.lower()
+        else:
+            # Encode an internationalized domain name to its ASCII
+            # Compatible Encoding (RFC 3490) so the stored address is
+            # always plain ASCII.
+            local_part, _, domain_name = email_address.rpartition('@')
+            email_address = f"{local_part}@{domain_name.encode('idna').decode('ascii')}".lower()
+
+        if not REGEX_EMAIL_ADDRESS.fullmatch(email_address):
+            raise ValueError(f'Invalid email address "{email_address}"')
+        self._email_address = email_address
+
+        # Both attributes are set once and never mutated, so the string
+        # representation can be computed eagerly and reused on every
+        # call to `__str__`.  A nameless mailbox is represented by its
+        # bare address, without a quoted empty name.
+        self._string_representation = self._email_address if not self._name \
+            else '"%s" <%s>' % (self._name, self._email_address)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Mailbox):
+            return NotImplemented
+        return self._email_address == other._email_address \
+            and self._name == other._name
+
+    def __hash__(self) -> int:
+        return hash((self._email_address, self._name))
 
     def __str__(self) -> str:
-        return f'"{self.__name}" <{self.__email_address}>'
+        return self._string_representation
 
     @property
     def email_address(self) -> str:
@@ -279,7 +626,7 @@ class Mailbox:
 
         :return: The email address as a string.
         """
-        return self.__email_address
+        return self._email_address
 
     @staticmethod
     def from_json(payload: dict) -> Mailbox | None:
@@ -300,20 +647,72 @@ class Mailbox:
         :raise ValueError: If the value of the key ``email_address`` is not a
             valid email address.
         """
-        return payload and Mailbox(
+        return payload and _intern_mailbox(
             payload['email_address'],
-            name=payload.get('name')
+            payload.get('name')
         )
 
+    @staticmethod
+    def from_json_many(payloads: Iterable[dict]) -> list[Mailbox]:
+        """
+        Create `Mailbox` instances from a collection of JSON-like
+        dictionaries.
+
+
+        :param payloads: A collection of dictionaries, each containing the
+            keys ``email_address`` and optionally ``name``.
+
+
+        :return: A list of ``Mailbox`` instances.
+
+
+        :raise ValueError: If the value of a key ``email_address`` is not
+            a valid email address.
+        """
+        return list(map(Mailbox.from_json, payloads))
+
     @property
     def name(self) -> str:
-        return self.__name
+        return self._name
+
+
+@functools.lru_cache(maxsize=4096)
+def _intern_mailbox(email_address: str, name: str | None) -> Mailbox:
+    """
+    Return a shared `Mailbox` instance for the given address and name.
+
+    Mailboxes are immutable value objects, and the same pair frequently
+    recurs in JSON payloads (distribution lists, shared "no-reply"
+    addresses).  Interning them through a bounded cache reuses a single
+    instance instead of allocating a fresh one per occurrence.
+
+
+    :param email_address: Electronic mail address of the mailbox.
+
+    :param name: The name of the owner of the mailbox.
+
+
+    :return: A possibly shared ``Mailbox`` instance.
+    """
+    return Mailbox(email_address, name=name)
 
 
 class Email:
     """
     Represent a message to be sent as an electronic mail to recipient(s).
     """
+    __slots__ = (
+        '_attached_files',
+        '_author',
+        '_bcc_recipients',
+        '_cc_recipients',
+        '_content',
+        '_html_content',
+        '_recipients',
+        '_subject',
+        '_text_content',
+    )
+
     def __init__(
             self,
             author: Mailbox,
@@ -361,51 +760,62 @@ class Email:
             corresponding to the full path and name of the files to attached
             to this message.
         """
-        if any_utils.is_empty_or_none(html_content) and any_utils.is_empty_or_none(text_content):
+        if not (html_content or text_content):
             raise ValueError("Empty content")
 
-        self.__author = author
-        self.__recipients = self.__build_list(recipients)
-        self.__cc_recipients = self.__build_list(cc_recipients)
-        self.__bcc_recipients = self.__build_list(bcc_recipients)
-        self.__subject = subject
-        self.__text_content = text_content
-        self.__html_content = html_content
-        self.__attached_files = self.__build_list(attached_files)
+        self._author = author
+        self._recipients = self._to_tuple(recipients)
+        self._cc_recipients = self._to_tuple(cc_recipients)
+        self._bcc_recipients = self._to_tuple(bcc_recipients)
+        self._subject = subject
+        self._text_content = text_content
+        self._html_content = html_content
+        self._attached_files = self._to_tuple(attached_files)
+
+        # Both bodies are fixed at construction, so the preferred
+        # content can be computed eagerly rather than on first access.
+        self._content = html_content or text_content
 
     @staticmethod
-    def __build_list(value: Any) -> list | None:
+    def _to_tuple(value: Any) -> tuple:
         if value is None:
-            return None
+            return ()
+
+        # Concrete-type fast path: `type(value) is tuple` is a single
+        # pointer comparison, where an `isinstance` check against an
+        # abstract base class walks the ABC registry.  A tuple is
+        # immutable, so it can be stored without a defensive copy.
+        if type(value) is tuple:
+            return value
 
-        return value if isinstance(value, Iterable) else list(value)
+        # A lone `Mailbox` or path-like argument is itself iterable (or
+        # not iterable at all), so it must be wrapped explicitly rather
+        # than passed to `tuple`, which would either iterate it or raise.
+        if isinstance(value, (Mailbox, str, PathLike)):
+            return (value,)
+
+        return tuple(value)
 
     @staticmethod
-    def __parse_mailboxes_from_json(payload: dict | Iterable[dict]) -> Iterable[Mailbox] | None:
+    def _parse_mailboxes_from_json(payload: dict | Iterable[dict]) -> list[Mailbox] | None:
         if not payload:
             return None
 
-        # noinspection PyTypeChecker
-        # :note: `Mailbox.from_json` could possibly return `None` if payload was
-        #     `None`, which is not the case in this context.
-        recipients = list(Mailbox.from_json(payload)) if isinstance(payload, dict) \
-            else [
-                Mailbox.from_json(recipient_json)
-                for recipient_json in payload
-            ]
-
-        return recipients
+        # A single mailbox may be passed as a bare JSON object rather
+        # than a one-element array; wrap it instead of iterating it.
+        return [Mailbox.from_json(payload)] if isinstance(payload, dict) \
+            else Mailbox.from_json_many(payload)
 
     @property
-    def attached_files(self) -> Iterable[PathLike] | None:
+    def attached_files(self) -> tuple[PathLike, ...]:
         """
-        Return the list of files attached to this email.
+        Return the files attached to this email.
 
 
-        :return: An iterator of `PathLike` objects representing the attached
-            files.
+        :return: A tuple of `PathLike` objects representing the attached
+            files, empty if the email has no attachment.
         """
-        return self.__attached_files
+        return self._attached_files
 
     @property
     def author(self) -> Mailbox:
@@ -415,29 +825,29 @@ class Email:
 
         :return: The `Mailbox` object representing the email's author.
         """
-        return self.__author
+        return self._author
 
     @property
-    def bcc_recipients(self) -> Iterable[Mailbox] | None:
+    def bcc_recipients(self) -> tuple[Mailbox, ...]:
         """
         Return the Blind Carbon Copy (BCC) recipient(s) of the email.
 
 
-        :return: An iterable of `Mailbox` objects representing the BCC
-            recipients, or ``None`` if there are no BCC recipients.
+        :return: A tuple of `Mailbox` objects representing the BCC
+            recipients, empty if there are no BCC recipients.
         """
-        return self.__bcc_recipients
+        return self._bcc_recipients
 
     @property
-    def cc_recipients(self) -> Iterable[Mailbox] | None:
+    def cc_recipients(self) -> tuple[Mailbox, ...]:
         """
         Return the Carbon Copy (CC) recipient(s) of the email.
 
 
-        :return: An iterable of `Mailbox` objects representing the CC
-            recipients, or ``None`` if there are no CC recipients.
+        :return: A tuple of `Mailbox` objects representing the CC
+            recipients, empty if there are no CC recipients.
         """
-        return self.__cc_recipients
+        return self._cc_recipients
 
     @property
     def content(self) -> str:
@@ -448,7 +858,7 @@ class Email:
         :return: A string containing the email's body, either HTML or plain
             text.
         """
-        return self.__html_content or self.__text_content
+        return self._content
 
     @classmethod
     def from_json(cls, payload):
@@ -457,9 +867,9 @@ class Email:
 
         author = Mailbox.from_json(payload['author'])
         subject = payload['subject']
-        recipients = cls.__parse_mailboxes_from_json(payload['recipients'])
-        cc_recipients = cls.__parse_mailboxes_from_json(payload.get('cc_recipients'))
-        bcc_recipients = cls.__parse_mailboxes_from_json(payload.get('bcc_recipients'))
+        recipients = cls._parse_mailboxes_from_json(payload['recipients'])
+        cc_recipients = cls._parse_mailboxes_from_json(payload.get('cc_recipients'))
+        bcc_recipients = cls._parse_mailboxes_from_json(payload.get('bcc_recipients'))
         html_content = payload.get('html_content')
         text_content = payload.get('text_content')
 
@@ -482,18 +892,18 @@ class Email:
         :return: A string containing the HTML content, or ``None`` if not
             provided.
         """
-        return self.__html_content
+        return self._html_content
 
     @property
-    def recipients(self) -> Iterable[Mailbox]:
+    def recipients(self) -> tuple[Mailbox, ...]:
         """
         Return the primary recipients of the email.
 
 
-        :return: An iterable of ``Mailbox`` objects representing the primary
+        :return: A tuple of ``Mailbox`` objects representing the primary
             recipients.
         """
-        return self.__recipients
+        return self._recipients
 
     @property
     def subject(self) -> str:
@@ -509,7 +919,7 @@ class Email:
 
         :return: A string representing the email's subject.
         """
-        return self.__subject
+        return self._subject
 
     @property
     def text_content(self) -> str | None:
@@ -520,4 +930,4 @@ class Email:
         :return: A string containing the plain text content, or ``None`` if
             not provided.
         """
-        return self.__text_content
+        return self._text_content